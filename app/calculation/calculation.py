@@ -2,8 +2,12 @@
 Calculation module containing the Calculation class and CalculationFactory.
 """
 
+from numbers import Real
 from typing import Any
 
+# Marks a result that has not been computed yet, distinct from any real result
+_UNSET = object()
+
 
 class Calculation:
     """
@@ -13,7 +17,9 @@ class Calculation:
     implementing object-oriented principles for clean code organization.
     """
     
-    def __init__(self, operand_a: float, operand_b: float, operation: Any, result: float = None):
+    __slots__ = ('operand_a', 'operand_b', 'operation', '_result', '_str_cache')
+    
+    def __init__(self, operand_a: float, operand_b: float, operation: Any, result: Any = _UNSET):
         """
         Initialize a calculation instance.
         
@@ -21,12 +27,15 @@ class Calculation:
             operand_a (float): The first operand
             operand_b (float): The second operand
             operation: The operation object that performs the calculation
-            result (float, optional): The result of the calculation
+            result (float, optional): A precomputed result. When omitted, the result
+                is computed lazily on first access; any value passed, including
+                None, is stored as-is
         """
         self.operand_a = operand_a
         self.operand_b = operand_b
         self.operation = operation
         self._result = result
+        self._str_cache = None
     
     @property
     def result(self) -> float:
@@ -36,9 +45,10 @@ class Calculation:
         Returns:
             float: The calculation result
         """
-        if self._result is None:
-            self._result = self.operation.compute(self.operand_a, self.operand_b)
-        return self._result
+        result = self._result
+        if result is _UNSET:
+            result = self._result = self.operation.compute(self.operand_a, self.operand_b)
+        return result
     
     def __str__(self) -> str:
         """
@@ -47,7 +57,10 @@ class Calculation:
         Returns:
             str: Human-readable representation of the calculation
         """
-        return f"{self.operand_a} {self.operation.symbol} {self.operand_b} = {self.result}"
+        # The rendering never changes once the result is known, so build it once
+        if self._str_cache is None:
+            self._str_cache = f"{self.operand_a} {self.operation.symbol} {self.operand_b} = {self.result}"
+        return self._str_cache
     
     def __repr__(self) -> str:
         """
@@ -57,7 +70,8 @@ class Calculation:
             str: Detailed representation of the calculation
         """
         return (f"Calculation(operand_a={self.operand_a}, operand_b={self.operand_b}, "
-                f"operation={self.operation.__class__.__name__}, result={self._result})")
+                f"operation={self.operation.__class__.__name__}, "
+                f"result={None if self._result is _UNSET else self._result})")
 
 
 class CalculationFactory:
@@ -70,7 +84,8 @@ class CalculationFactory:
     """
     
     @staticmethod
-    def create_calculation(operand_a: float, operand_b: float, operation: Any) -> Calculation:
+    def create_calculation(operand_a: float, operand_b: float, operation: Any,
+                           eager: bool = False) -> Calculation:
         """
         Create a new calculation instance.
         
@@ -78,25 +93,35 @@ class CalculationFactory:
             operand_a (float): The first operand
             operand_b (float): The second operand
             operation: The operation object
+            eager (bool, optional): Compute the result while creating the calculation
             
         Returns:
             Calculation: A new calculation instance
             
         Raises:
-            ValueError: If operands are invalid
-            TypeError: If operation is invalid
+            TypeError: If an operand is not a real number or the operation is invalid
+            ArithmeticError: If eager and the operation cannot be performed
         """
-        # Input validation using LBYL (Look Before You Leap) paradigm
-        if not isinstance(operand_a, (int, float)):
+        # Input validation using LBYL (Look Before You Leap) paradigm; float() alone
+        # would also parse text such as "5", b"nan" or bytearray(b"7")
+        if not isinstance(operand_a, Real):
             raise TypeError(f"First operand must be a number, got {type(operand_a).__name__}")
         
-        if not isinstance(operand_b, (int, float)):
+        if not isinstance(operand_b, Real):
             raise TypeError(f"Second operand must be a number, got {type(operand_b).__name__}")
         
-        if not hasattr(operation, 'compute'):
+        operand_a = float(operand_a)
+        operand_b = float(operand_b)
+        
+        try:
+            operation.compute
+        except AttributeError:
             raise TypeError("Operation must have a 'compute' method")
         
-        if not hasattr(operation, 'symbol'):
+        try:
+            operation.symbol
+        except AttributeError:
             raise TypeError("Operation must have a 'symbol' attribute")
         
-        return Calculation(float(operand_a), float(operand_b), operation)
\ No newline at end of file
+        result = operation.compute(operand_a, operand_b) if eager else _UNSET
+        return Calculation(operand_a, operand_b, operation, result)
\ No newline at end of file
@@ -2,10 +2,34 @@
 Calculator module containing the main Calculator class with history management.
 """
 
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from math import isfinite
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+import re
 import sys
-from app.calculation.calculation import Calculation, CalculationFactory
-from app.operation.operations import OPERATIONS
+from app.calculation.calculation import Calculation
+from app.operation.operations import OPERATIONS, OPERATION_KEYS, OP_FNS
+
+if TYPE_CHECKING:  # pragma: no cover
+    from app.calculator.history_buffer import HistoryBuffer
+
+# Decimal or exponent literal accepted as an operand, e.g. "5", "-.5", "5." or "1e6"
+_NUMBER_PATTERN = r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?'
+
+# Matches a single number, padded with optional whitespace
+_NUM_RE = re.compile(rf'^\s*{_NUMBER_PATTERN}\s*$')
+
+# Matches "<number> <operation> <number>" using the same number grammar
+_EXPR_RE = re.compile(rf'^\s*({_NUMBER_PATTERN})\s+(\S+)\s+({_NUMBER_PATTERN})\s*$')
+
+# Matches any three whitespace-separated tokens, for input the fast path rejects
+_TOKENS_RE = re.compile(r'^\s*(\S+)\s+(\S+)\s+(\S+)\s*$')
+
+# Special commands recognized by the REPL
+_VALID_COMMANDS = frozenset(('help', 'history', 'exit', 'quit', 'clear'))
+
+# Operation names listed in error messages, sorted once at import
+_AVAILABLE_OPERATIONS = ', '.join(sorted(OPERATION_KEYS))
 
 
 class CalculationHistory:
@@ -16,6 +40,8 @@ class CalculationHistory:
     calculation history with proper encapsulation.
     """
     
+    __slots__ = ('_history',)
+    
     def __init__(self):
         """Initialize an empty calculation history."""
         self._history: List[Calculation] = []
@@ -31,14 +57,14 @@ class CalculationHistory:
             raise TypeError("Must provide a Calculation instance")
         self._history.append(calculation)
     
-    def get_history(self) -> List[Calculation]:
+    def get_history(self) -> Tuple[Calculation, ...]:
         """
-        Get a copy of the calculation history.
+        Get a read-only snapshot of the calculation history.
         
         Returns:
-            List[Calculation]: Copy of the calculation history
+            Tuple[Calculation, ...]: Immutable copy of the calculation history
         """
-        return self._history.copy()
+        return tuple(self._history)
     
     def get_last_calculation(self) -> Optional[Calculation]:
         """
@@ -53,6 +79,26 @@ class CalculationHistory:
         """Clear all calculations from history."""
         self._history.clear()
     
+    def to_buffer(self) -> 'HistoryBuffer':
+        """
+        Copy the history into a column-oriented buffer for bulk analysis.
+        
+        Returns:
+            HistoryBuffer: A buffer holding every calculation in history
+            
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        from app.calculator.history_buffer import HistoryBuffer
+        buffer = HistoryBuffer(len(self._history))
+        for calculation in self._history:
+            buffer.add_calculation(calculation)
+        return buffer
+    
+    def __iter__(self) -> Iterator[Calculation]:
+        """Iterate over the calculations in history without copying them."""
+        return iter(self._history)
+    
     def __len__(self) -> int:
         """Return the number of calculations in history."""
         return len(self._history)
@@ -62,65 +108,83 @@ class CalculationHistory:
         return bool(self._history)
 
 
-class InputValidator:
+def validate_number(value: str) -> float:
     """
-    Handles validation of user inputs.
+    Validate and convert a string to a number.
     
-    This class provides static methods for validating different types
-    of user input using both LBYL and EAFP paradigms.
+    Args:
+        value (str): The string to validate
+        
+    Returns:
+        float: The converted number
+        
+    Raises:
+        ValueError: If the value cannot be converted to a number
     """
+    # Using LBYL (Look Before You Leap) paradigm: the regex rejects malformed
+    # input, including inf and nan, so float() never raises
+    if _NUM_RE.match(value) is None:
+        raise ValueError(f"'{value}' is not a valid number")
+    result = float(value)
+    # Reject literals that overflow to infinity, such as 1e999
+    if not isfinite(result):
+        raise ValueError(f"'{value}' is not a valid number")
+    return result
+
+
+# Memoized on the raw string, so repeated input skips normalization entirely
+@lru_cache(maxsize=256)
+def _is_valid_operation(operation: str) -> bool:
+    """Return True if the normalized string names a supported operation."""
+    return operation.lower().strip() in OPERATION_KEYS
+
+
+@lru_cache(maxsize=256)
+def _is_valid_command(command: str) -> bool:
+    """Return True if the normalized string names a special command."""
+    return command.lower().strip() in _VALID_COMMANDS
+
+
+def validate_operation(operation: str) -> bool:
+    """
+    Validate if an operation is supported.
     
-    @staticmethod
-    def validate_number(value: str) -> float:
-        """
-        Validate and convert a string to a number.
+    Args:
+        operation (str): The operation to validate
         
-        Args:
-            value (str): The string to validate
-            
-        Returns:
-            float: The converted number
-            
-        Raises:
-            ValueError: If the value cannot be converted to a number
-        """
-        # Using EAFP (Easier to Ask Forgiveness than Permission) paradigm
-        try:
-            result = float(value.strip())
-            # Check for special float values that we want to reject
-            if result == float('inf') or result == float('-inf') or result != result:  # NaN check
-                raise ValueError(f"'{value}' is not a valid number")
-            return result
-        except ValueError:
-            raise ValueError(f"'{value}' is not a valid number")
+    Returns:
+        bool: True if operation is valid
+    """
+    # Using LBYL (Look Before You Leap) paradigm
+    return _is_valid_operation(operation)
+
+
+def validate_command(command: str) -> bool:
+    """
+    Validate if a command is a special command.
     
-    @staticmethod
-    def validate_operation(operation: str) -> bool:
-        """
-        Validate if an operation is supported.
+    Args:
+        command (str): The command to validate
         
-        Args:
-            operation (str): The operation to validate
-            
-        Returns:
-            bool: True if operation is valid
-        """
-        # Using LBYL (Look Before You Leap) paradigm
-        return operation.lower().strip() in OPERATIONS
+    Returns:
+        bool: True if command is valid
+    """
+    return _is_valid_command(command)
+
+
+class InputValidator:
+    """
+    Handles validation of user inputs.
     
-    @staticmethod
-    def validate_command(command: str) -> bool:
-        """
-        Validate if a command is a special command.
-        
-        Args:
-            command (str): The command to validate
-            
-        Returns:
-            bool: True if command is valid
-        """
-        valid_commands = {'help', 'history', 'exit', 'quit', 'clear'}
-        return command.lower().strip() in valid_commands
+    The validators are module-level functions so call sites avoid attribute
+    lookups; this class exposes them as static methods for existing callers.
+    """
+    
+    __slots__ = ()
+    
+    validate_number = staticmethod(validate_number)
+    validate_operation = staticmethod(validate_operation)
+    validate_command = staticmethod(validate_command)
 
 
 class Calculator:
@@ -131,10 +195,11 @@ class Calculator:
     handling user interaction, calculation execution, and history management.
     """
     
+    __slots__ = ('history', 'running')
+    
     def __init__(self):
         """Initialize the calculator with empty history."""
         self.history = CalculationHistory()
-        self.validator = InputValidator()
         self.running = False
     
     def run(self) -> None:
@@ -147,6 +212,11 @@ class Calculator:
         self.running = True
         self._display_welcome()
         
+        # Bind the per-line callables to locals once instead of per iteration
+        is_command = self._is_command
+        handle_command = self._handle_command
+        handle_calculation_input = self._handle_calculation_input
+        
         while self.running:
             try:
                 user_input = input("\nCalculator> ").strip()
@@ -155,13 +225,16 @@ class Calculator:
                 if not user_input:
                     continue
                 
+                # Split once and share the tokens with the handlers below
+                parts = user_input.split()
+                
                 # Handle special commands
-                if self._is_command(user_input):
-                    self._handle_command(user_input.lower())
+                if is_command(user_input, parts):
+                    handle_command(user_input.lower())
                     continue
                 
                 # Parse and execute calculation
-                self._handle_calculation_input(user_input)
+                handle_calculation_input(user_input, parts)
                 
             except KeyboardInterrupt:
                 print("\n\nGoodbye!")
@@ -182,17 +255,20 @@ class Calculator:
         print("Supported operations: +, -, *, /")
         print("Example: 5 + 3 or add 5 3")
     
-    def _is_command(self, user_input: str) -> bool:
+    def _is_command(self, user_input: str, parts: Optional[List[str]] = None) -> bool:
         """
         Check if user input is a special command.
         
         Args:
             user_input (str): The user input to check
+            parts (List[str], optional): The input already split into tokens
             
         Returns:
             bool: True if input is a command
         """
-        return self.validator.validate_command(user_input.split()[0])
+        if parts is None:
+            parts = user_input.split()
+        return validate_command(parts[0])
     
     def _handle_command(self, command: str) -> None:
         """
@@ -201,7 +277,7 @@ class Calculator:
         Args:
             command (str): The command to handle
         """
-        if command in ['exit', 'quit']:
+        if command in ('exit', 'quit'):
             print("Goodbye!")
             self.running = False
         elif command == 'help':
@@ -237,27 +313,27 @@ class Calculator:
             print("No calculations in history.")
             return
         
-        print("\n" + "=" * 30)
-        print("CALCULATION HISTORY")
-        print("=" * 30)
-        for i, calc in enumerate(self.history.get_history(), 1):
-            print(f"{i:2d}. {calc}")
-        print("=" * 30)
+        # Emit the whole listing with a single write instead of one per entry
+        lines = ["\n" + "=" * 30, "CALCULATION HISTORY", "=" * 30]
+        lines.extend(f"{i:2d}. {calc}" for i, calc in enumerate(self.history, 1))
+        lines.append("=" * 30)
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def _clear_history(self) -> None:
         """Clear calculation history."""
         self.history.clear_history()
         print("Calculation history cleared.")
     
-    def _handle_calculation_input(self, user_input: str) -> None:
+    def _handle_calculation_input(self, user_input: str, parts: Optional[List[str]] = None) -> None:
         """
         Parse and execute a calculation from user input.
         
         Args:
             user_input (str): The user input to parse
+            parts (List[str], optional): The input already split into tokens
         """
         try:
-            operand_a, operation_str, operand_b = self._parse_input(user_input)
+            operand_a, operation_str, operand_b = self._parse_input(user_input, parts)
             calculation = self._perform_calculation(operand_a, operation_str, operand_b)
             
             if calculation:
@@ -271,12 +347,13 @@ class Calculator:
         except Exception as e:  # pragma: no cover
             print(f"Error: {e}")
     
-    def _parse_input(self, user_input: str) -> Tuple[float, str, float]:
+    def _parse_input(self, user_input: str, parts: Optional[List[str]] = None) -> Tuple[float, str, float]:
         """
         Parse user input into operands and operation.
         
         Args:
             user_input (str): The input to parse
+            parts (List[str], optional): The input already split into tokens
             
         Returns:
             Tuple[float, str, float]: The parsed operands and operation
@@ -284,43 +361,58 @@ class Calculator:
         Raises:
             ValueError: If input format is invalid
         """
-        parts = user_input.split()
-        
-        if len(parts) != 3:
-            raise ValueError("Please provide exactly three parts: number operation number")
-        
-        operand_a_str, operation_str, operand_b_str = parts
+        # Fast path: one regex scan tokenizes and checks both operands
+        match = _EXPR_RE.match(user_input)
+        if match is not None:
+            operand_a_str, operation_str, operand_b_str = match.groups()
+            operand_a = float(operand_a_str)
+            operand_b = float(operand_b_str)
+            if not (isfinite(operand_a) and isfinite(operand_b)):
+                # Literals such as 1e999 overflow; let the validator report them
+                match = None
         
-        # Validate operands
-        operand_a = self.validator.validate_number(operand_a_str)
-        operand_b = self.validator.validate_number(operand_b_str)
+        if match is None:
+            if parts is None:
+                # One scan checks for three tokens and extracts them without a list
+                tokens = _TOKENS_RE.match(user_input)
+                parts = tokens.groups() if tokens is not None else ()
+            
+            if len(parts) != 3:
+                raise ValueError("Please provide exactly three parts: number operation number")
+            
+            operand_a_str, operation_str, operand_b_str = parts
+            
+            # Validate operands
+            operand_a = validate_number(operand_a_str)
+            operand_b = validate_number(operand_b_str)
         
-        # Validate operation
-        if not self.validator.validate_operation(operation_str):
-            available_ops = list(set(OPERATIONS.keys()))
+        # Validate operation, normalizing it once for the rest of the pipeline
+        operation_key = operation_str.lower()
+        if operation_key not in OPERATION_KEYS:
             raise ValueError(f"Unsupported operation: {operation_str}. "
-                           f"Available: {', '.join(sorted(available_ops))}")
+                           f"Available: {_AVAILABLE_OPERATIONS}")
         
-        return operand_a, operation_str.lower(), operand_b
+        return operand_a, operation_key, operand_b
     
     def _perform_calculation(self, operand_a: float, operation_str: str, operand_b: float) -> Optional[Calculation]:
         """
-        Perform a calculation using the factory pattern.
+        Perform a calculation for already validated input.
+        
+        The operands come from the parser as floats and the operation from the
+        registry, so the factory's input checks are skipped on this path.
         
         Args:
             operand_a (float): First operand
-            operation_str (str): Operation string
+            operation_str (str): Normalized operation string
             operand_b (float): Second operand
             
         Returns:
             Optional[Calculation]: The calculation result or None if error
         """
         try:
-            operation = OPERATIONS[operation_str]
-            calculation = CalculationFactory.create_calculation(operand_a, operand_b, operation)
-            # Test the calculation to catch any computation errors
-            _ = calculation.result
-            return calculation
+            # Computing eagerly surfaces errors here and skips the lazy check later
+            result = OP_FNS[operation_str](operand_a, operand_b)
+            return Calculation(operand_a, operand_b, OPERATIONS[operation_str], result)
         except ZeroDivisionError as e:
             print(f"Math error: {e}")
             return None
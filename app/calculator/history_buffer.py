@@ -0,0 +1,159 @@
+"""
+Column-oriented calculation history backed by NumPy arrays.
+"""
+
+from typing import List
+
+import numpy as np
+
+from app.calculation.calculation import Calculation
+from app.operation.operations import OPERATIONS
+
+# Operation ids stored in the buffer, indexed by canonical symbol
+_SYMBOLS = ('+', '-', '*', '/')
+_OP_IDS = {symbol: op_id for op_id, symbol in enumerate(_SYMBOLS)}
+_OPERATIONS_BY_ID = tuple(OPERATIONS[symbol] for symbol in _SYMBOLS)
+_UFUNCS_BY_ID = (np.add, np.subtract, np.multiply, np.divide)
+
+_INITIAL_CAPACITY = 64
+
+
+class HistoryBuffer:
+    """
+    Stores calculations as parallel arrays of operands, operation ids and results.
+    
+    Keeping each field in its own contiguous array (structure of arrays) costs
+    a few bytes per entry instead of a Python object, and lets the whole history
+    be recomputed with one vectorized call per operation.
+    """
+    
+    __slots__ = ('_a', '_b', '_op', '_r', '_n', '_cap')
+    
+    def __init__(self, capacity: int = _INITIAL_CAPACITY):
+        """
+        Initialize an empty buffer.
+        
+        Args:
+            capacity (int, optional): Number of entries to preallocate
+        """
+        self._cap = max(1, capacity)
+        self._n = 0
+        self._a = np.empty(self._cap, dtype=np.float64)
+        self._b = np.empty(self._cap, dtype=np.float64)
+        self._op = np.empty(self._cap, dtype=np.int8)
+        self._r = np.empty(self._cap, dtype=np.float64)
+    
+    def _grow(self) -> None:
+        """Double the capacity of every column."""
+        self._cap *= 2
+        self._a = np.resize(self._a, self._cap)
+        self._b = np.resize(self._b, self._cap)
+        self._op = np.resize(self._op, self._cap)
+        self._r = np.resize(self._r, self._cap)
+    
+    def add_calculation(self, calculation: Calculation) -> None:
+        """
+        Append a calculation to the buffer.
+        
+        Args:
+            calculation (Calculation): The calculation to add
+            
+        Raises:
+            TypeError: If the value is not a Calculation
+            ValueError: If the calculation uses an operation the buffer cannot store
+        """
+        if not isinstance(calculation, Calculation):
+            raise TypeError("Must provide a Calculation instance")
+        
+        symbol = calculation.operation.symbol
+        if symbol not in _OP_IDS:
+            raise ValueError(f"Unsupported operation for history buffer: {symbol}")
+        
+        result = calculation.result
+        if self._n == self._cap:
+            self._grow()
+        
+        n = self._n
+        self._a[n] = calculation.operand_a
+        self._b[n] = calculation.operand_b
+        self._op[n] = _OP_IDS[symbol]
+        self._r[n] = result
+        self._n = n + 1
+    
+    @property
+    def operands_a(self) -> np.ndarray:
+        """Return a read-only view of the first operands."""
+        return self._view(self._a)
+    
+    @property
+    def operands_b(self) -> np.ndarray:
+        """Return a read-only view of the second operands."""
+        return self._view(self._b)
+    
+    @property
+    def results(self) -> np.ndarray:
+        """Return a read-only view of the stored results."""
+        return self._view(self._r)
+    
+    def _view(self, column: np.ndarray) -> np.ndarray:
+        """Return the filled part of a column as a read-only view."""
+        view = column[:self._n]
+        view.flags.writeable = False
+        return view
+    
+    def replay(self) -> np.ndarray:
+        """
+        Recompute every result in the buffer with vectorized operations.
+        
+        Returns:
+            np.ndarray: The recomputed results, in insertion order
+        """
+        n = self._n
+        operands_a, operands_b, op_ids = self._a[:n], self._b[:n], self._op[:n]
+        results = np.empty(n, dtype=np.float64)
+        for op_id, ufunc in enumerate(_UFUNCS_BY_ID):
+            mask = op_ids == op_id
+            if mask.any():
+                ufunc(operands_a, operands_b, out=results, where=mask)
+        return results
+    
+    def get_history(self) -> List[Calculation]:
+        """
+        Materialize the buffer as Calculation objects.
+        
+        Returns:
+            List[Calculation]: New calculations, in insertion order
+        """
+        return [self[i] for i in range(self._n)]
+    
+    def clear_history(self) -> None:
+        """Remove all entries while keeping the allocated capacity."""
+        self._n = 0
+    
+    def __getitem__(self, index: int) -> Calculation:
+        """
+        Materialize a single entry as a Calculation.
+        
+        Args:
+            index (int): Position of the entry; negative values count from the end
+            
+        Returns:
+            Calculation: A new calculation holding the stored values
+            
+        Raises:
+            IndexError: If the index is out of range
+        """
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("History buffer index out of range")
+        return Calculation(float(self._a[index]), float(self._b[index]),
+                           _OPERATIONS_BY_ID[self._op[index]], float(self._r[index]))
+    
+    def __len__(self) -> int:
+        """Return the number of entries in the buffer."""
+        return self._n
+    
+    def __bool__(self) -> bool:
+        """Return True if the buffer contains entries."""
+        return self._n > 0
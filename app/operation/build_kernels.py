@@ -0,0 +1,28 @@
+"""
+Ahead-of-time compilation of the batch kernels into the ``op_kernels`` extension.
+
+The extension is optional. ``setup.py`` tries to build it when Numba is
+importable at build time, and skips it if compilation fails. It can also be
+built manually with::
+
+    python -m app.operation.build_kernels
+
+which writes the compiled module next to this file. ``numba.pycc`` is pending
+deprecation upstream, so the JIT path in ``kernels.py`` is the supported default.
+"""
+
+from numba.pycc import CC
+
+from app.operation.kernels import _add_kernel, _sub_kernel, _mul_kernel, _div_kernel
+
+_SIGNATURE = 'f8[:](f8[:], f8[:])'
+
+cc = CC('op_kernels')
+cc.export('add_arr', _SIGNATURE)(_add_kernel)
+cc.export('sub_arr', _SIGNATURE)(_sub_kernel)
+cc.export('mul_arr', _SIGNATURE)(_mul_kernel)
+cc.export('div_arr', _SIGNATURE)(_div_kernel)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    cc.compile()
@@ -0,0 +1,93 @@
+"""
+Batch arithmetic kernels for evaluating operations over arrays of operands.
+
+The kernels are compiled with Numba so that a whole array of operand pairs is
+evaluated in a single machine-code loop instead of one Python call per pair.
+When the package was built with the ahead-of-time ``op_kernels`` extension
+(see ``build_kernels.py``) it is used directly, with no JIT compilation or
+Numba import at runtime. Otherwise the kernels are JIT-compiled on first use
+and cached to disk. The scalar ``Operation.compute`` methods remain the path
+used by the REPL.
+"""
+
+import numpy as np
+
+
+def _add_kernel(operands_a: np.ndarray, operands_b: np.ndarray) -> np.ndarray:
+    """Element-wise addition of two operand arrays."""
+    result = np.empty(operands_a.shape[0])
+    for i in range(operands_a.shape[0]):
+        result[i] = operands_a[i] + operands_b[i]
+    return result
+
+
+def _sub_kernel(operands_a: np.ndarray, operands_b: np.ndarray) -> np.ndarray:
+    """Element-wise subtraction of two operand arrays."""
+    result = np.empty(operands_a.shape[0])
+    for i in range(operands_a.shape[0]):
+        result[i] = operands_a[i] - operands_b[i]
+    return result
+
+
+def _mul_kernel(operands_a: np.ndarray, operands_b: np.ndarray) -> np.ndarray:
+    """Element-wise multiplication of two operand arrays."""
+    result = np.empty(operands_a.shape[0])
+    for i in range(operands_a.shape[0]):
+        result[i] = operands_a[i] * operands_b[i]
+    return result
+
+
+def _div_kernel(operands_a: np.ndarray, operands_b: np.ndarray) -> np.ndarray:
+    """Element-wise division of two operand arrays."""
+    result = np.empty(operands_a.shape[0])
+    for i in range(operands_a.shape[0]):
+        if operands_b[i] == 0.0:
+            raise ZeroDivisionError("Cannot divide by zero")
+        result[i] = operands_a[i] / operands_b[i]
+    return result
+
+
+try:
+    from app.operation import op_kernels
+except ImportError:
+    import numba
+    
+    _jit = numba.njit(cache=True)
+    
+    # Batch kernel registry, keyed by operation symbol
+    BATCH_OPERATIONS = {
+        '+': _jit(_add_kernel),
+        '-': _jit(_sub_kernel),
+        '*': _jit(_mul_kernel),
+        '/': _jit(_div_kernel),
+    }
+else:  # pragma: no cover - only taken when the optional extension was built
+    BATCH_OPERATIONS = {
+        '+': op_kernels.add_arr,
+        '-': op_kernels.sub_arr,
+        '*': op_kernels.mul_arr,
+        '/': op_kernels.div_arr,
+    }
+
+
+def compute_batch(symbol: str, operands_a, operands_b) -> np.ndarray:
+    """
+    Apply the operation identified by ``symbol`` to arrays of operands.
+    
+    Args:
+        symbol (str): The operation symbol ('+', '-', '*' or '/')
+        operands_a: Sequence or array of first operands
+        operands_b: Sequence or array of second operands
+        
+    Returns:
+        np.ndarray: Array of results, one per operand pair
+        
+    Raises:
+        ValueError: If the operand arrays differ in length
+        ZeroDivisionError: If dividing by a zero operand
+    """
+    operands_a = np.ascontiguousarray(operands_a, dtype=np.float64).ravel()
+    operands_b = np.ascontiguousarray(operands_b, dtype=np.float64).ravel()
+    if operands_a.shape != operands_b.shape:
+        raise ValueError("Operand arrays must have the same length")
+    return BATCH_OPERATIONS[symbol](operands_a, operands_b)
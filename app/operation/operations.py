@@ -13,6 +13,9 @@ class Operation(ABC):
     following the Template Method and Strategy patterns.
     """
     
+    # Operations are stateless singletons, so no instance dict is needed
+    __slots__ = ()
+    
     @property
     @abstractmethod
     def symbol(self) -> str:
@@ -40,11 +43,36 @@ class Operation(ABC):
             ArithmeticError: If the operation cannot be performed
         """
         pass  # pragma: no cover
+    
+    def compute_batch(self, operands_a, operands_b):
+        """
+        Perform the operation element-wise over arrays of operands.
+        
+        The compiled kernels are imported lazily so that the interactive
+        calculator does not pay the Numba import cost on startup, and so
+        NumPy and Numba are only needed with the optional ``batch`` extra.
+        
+        Args:
+            operands_a: Sequence or array of first operands
+            operands_b: Sequence or array of second operands
+        
+        Returns:
+            numpy.ndarray: The results, one per operand pair
+        
+        Raises:
+            ImportError: If NumPy or Numba is not installed
+            ValueError: If the operand arrays differ in length
+            ZeroDivisionError: If dividing by a zero operand
+        """
+        from app.operation.kernels import compute_batch
+        return compute_batch(self.symbol, operands_a, operands_b)
 
 
 class Addition(Operation):
     """Addition operation implementation."""
     
+    __slots__ = ()
+    
     @property
     def symbol(self) -> str:
         """Return the addition symbol."""
@@ -67,6 +95,8 @@ class Addition(Operation):
 class Subtraction(Operation):
     """Subtraction operation implementation."""
     
+    __slots__ = ()
+    
     @property
     def symbol(self) -> str:
         """Return the subtraction symbol."""
@@ -89,6 +119,8 @@ class Subtraction(Operation):
 class Multiplication(Operation):
     """Multiplication operation implementation."""
     
+    __slots__ = ()
+    
     @property
     def symbol(self) -> str:
         """Return the multiplication symbol."""
@@ -111,6 +143,8 @@ class Multiplication(Operation):
 class Division(Operation):
     """Division operation implementation."""
     
+    __slots__ = ()
+    
     @property
     def symbol(self) -> str:
         """Return the division symbol."""
@@ -130,11 +164,10 @@ class Division(Operation):
         Raises:
             ZeroDivisionError: If attempting to divide by zero
         """
-        # Using EAFP (Easier to Ask Forgiveness than Permission) paradigm
-        try:
-            return operand_a / operand_b
-        except ZeroDivisionError:
+        # Using LBYL (Look Before You Leap) paradigm to avoid a try block per call
+        if operand_b == 0:
             raise ZeroDivisionError("Cannot divide by zero")
+        return operand_a / operand_b
 
 
 # Create singleton instances for each operation
@@ -143,21 +176,19 @@ _subtraction = Subtraction()
 _multiplication = Multiplication()
 _division = Division()
 
+# Every accepted name for each singleton, so all aliases share one instance
+_ALIASES = (
+    (_addition, ('+', 'add', 'addition')),
+    (_subtraction, ('-', 'sub', 'subtract', 'subtraction')),
+    (_multiplication, ('*', 'mul', 'multiply', 'multiplication')),
+    (_division, ('/', 'div', 'divide', 'division')),
+)
+
 # Operation registry for easy access
-OPERATIONS = {
-    '+': _addition,
-    'add': _addition,
-    'addition': _addition,
-    '-': _subtraction,
-    'sub': _subtraction,
-    'subtract': _subtraction,
-    'subtraction': _subtraction,
-    '*': _multiplication,
-    'mul': _multiplication,
-    'multiply': _multiplication,
-    'multiplication': _multiplication,
-    '/': _division,
-    'div': _division,
-    'divide': _division,
-    'division': _division,
-}
\ No newline at end of file
+OPERATIONS = {key: operation for operation, keys in _ALIASES for key in keys}
+
+# Immutable set of every accepted operation name, for membership checks
+OPERATION_KEYS = frozenset(OPERATIONS)
+
+# Bound compute method for every accepted operation name, resolved once at import
+OP_FNS = {key: operation.compute for key, operation in OPERATIONS.items()}
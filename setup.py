@@ -3,6 +3,9 @@ Setup configuration for the Calculator Application.
 """
 
 from setuptools import setup, find_packages
+from setuptools.command.build_ext import build_ext
+# Imported after setuptools, which provides distutils on Python 3.12+
+from distutils.errors import CCompilerError, DistutilsError
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -10,6 +13,38 @@ with open("README.md", "r", encoding="utf-8") as fh:
 with open("requirements.txt", "r", encoding="utf-8") as fh:
     requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
+
+class OptionalBuildExt(build_ext):
+    """Build extensions on a best-effort basis, skipping any that fail to compile."""
+    
+    def run(self):
+        try:
+            super().run()
+        except DistutilsError as e:
+            self.warn(f"Skipping optional extensions: {e}")
+    
+    def build_extension(self, ext):
+        try:
+            # Numba's extension compiles its object files in a hook that it
+            # monkey-patches onto distutils' build_ext, which this class bypasses
+            prepare = getattr(ext, "_prepare_object_files", None)
+            if prepare is not None:
+                prepare(self)
+            super().build_extension(ext)
+        except (CCompilerError, DistutilsError) as e:
+            self.warn(f"Skipping optional extension {ext.name}: {e}")
+
+
+# Compile the batch kernels ahead of time when Numba is importable at build time;
+# without the extension the kernels are JIT-compiled on first use instead.
+# Numba raises RuntimeError up front when it cannot find a C compiler.
+try:
+    from app.operation.build_kernels import cc
+except (ImportError, RuntimeError):
+    ext_modules = []
+else:
+    ext_modules = [cc.distutils_extension()]
+
 setup(
     name="calculator-app",
     version="1.0.0",
@@ -19,6 +54,8 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/kk795-NJIT/IS601_Module4",
     packages=find_packages(),
+    ext_modules=ext_modules,
+    cmdclass={"build_ext": OptionalBuildExt},
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Education",
@@ -37,8 +74,13 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "coverage>=7.0.0",
         ],
+        "batch": [
+            "numpy>=1.21.0",
+            "numba>=0.56.0",
+        ],
     },
     entry_points={
         "console_scripts": [
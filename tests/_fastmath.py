@@ -0,0 +1,48 @@
+"""
+Numba kernels used by the operation tests to cross-check case tables in bulk.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def add_all(operands_a, operands_b, out):
+    """Store the element-wise sums of the operands in ``out``."""
+    for i in range(operands_a.size):
+        out[i] = operands_a[i] + operands_b[i]
+
+
+@njit(cache=True)
+def sub_all(operands_a, operands_b, out):
+    """Store the element-wise differences of the operands in ``out``."""
+    for i in range(operands_a.size):
+        out[i] = operands_a[i] - operands_b[i]
+
+
+@njit(cache=True)
+def mul_all(operands_a, operands_b, out):
+    """Store the element-wise products of the operands in ``out``."""
+    for i in range(operands_a.size):
+        out[i] = operands_a[i] * operands_b[i]
+
+
+@njit(cache=True)
+def div_all(operands_a, operands_b, out):
+    """Store the element-wise quotients of the operands in ``out``."""
+    for i in range(operands_a.size):
+        out[i] = operands_a[i] / operands_b[i]
+
+
+def run(kernel, cases):
+    """
+    Apply a kernel to the operand columns of ``(operand_a, operand_b, expected)`` rows.
+    
+    Returns:
+        list: The kernel's results as Python floats, one per row
+    """
+    operands_a = np.array([case[0] for case in cases], dtype=np.float64)
+    operands_b = np.array([case[1] for case in cases], dtype=np.float64)
+    out = np.empty_like(operands_a)
+    kernel(operands_a, operands_b, out)
+    return out.tolist()
@@ -7,27 +7,27 @@ from app.operation.operations import Addition, Subtraction, Multiplication, Divi
 from app.calculation.calculation import Calculation, CalculationFactory
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def addition_operation():
-    """Fixture for addition operation."""
+    """Fixture for addition operation, shared across the session."""
     return Addition()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def subtraction_operation():
-    """Fixture for subtraction operation."""
+    """Fixture for subtraction operation, shared across the session."""
     return Subtraction()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiplication_operation():
-    """Fixture for multiplication operation."""
+    """Fixture for multiplication operation, shared across the session."""
     return Multiplication()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def division_operation():
-    """Fixture for division operation."""
+    """Fixture for division operation, shared across the session."""
     return Division()
 
 
@@ -40,4 +40,20 @@ def sample_calculation(addition_operation):
 @pytest.fixture
 def calculation_factory():
     """Fixture for calculation factory."""
-    return CalculationFactory()
\ No newline at end of file
+    return CalculationFactory()
+
+
+@pytest.fixture(scope="session")
+def calculator_cls():
+    """Fixture for the Calculator class, imported once per session."""
+    from app.calculator.calculator import Calculator
+    return Calculator
+
+
+@pytest.fixture
+def calculator(calculator_cls):
+    """Fixture for a calculator, reset after each test."""
+    calc = calculator_cls()
+    yield calc
+    calc.history.clear_history()
+    calc.running = False
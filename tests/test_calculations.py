@@ -2,8 +2,13 @@
 Comprehensive unit tests for calculation classes.
 """
 
+from decimal import Decimal
+from fractions import Fraction
+
 import pytest
-from app.calculation.calculation import Calculation, CalculationFactory
+from app.calculation.calculation import (
+    Calculation, CalculationFactory, _UNSET
+)
 from app.operation.operations import Addition, Subtraction, Multiplication, Division
 
 
@@ -16,7 +21,7 @@ class TestCalculation:
         assert calc.operand_a == 5.0
         assert calc.operand_b == 3.0
         assert calc.operation is addition_operation
-        assert calc._result is None
+        assert calc._result is _UNSET
     
     def test_calculation_initialization_with_result(self, addition_operation):
         """Test calculation initialization with pre-computed result."""
@@ -59,12 +64,41 @@ class TestCalculation:
         assert result1 == result2
         assert calc._result == result2
     
+    def test_calculation_none_result_computed_once(self):
+        """Test that a legitimately None result is not recomputed."""
+        class NoneOperation:
+            symbol = "?"
+            calls = 0
+            
+            def compute(self, a, b):
+                NoneOperation.calls += 1
+        
+        calc = Calculation(0.0, 1.0, NoneOperation())
+        assert calc.result is None
+        assert calc.result is None
+        assert NoneOperation.calls == 1
+    
+    def test_calculation_uses_slots(self, addition_operation):
+        """Test that calculations carry no per-instance __dict__."""
+        calc = Calculation(5.0, 3.0, addition_operation)
+        assert not hasattr(calc, '__dict__')
+        with pytest.raises(AttributeError):
+            calc.unknown_attribute = 1
+    
     def test_calculation_str_representation(self, addition_operation):
         """Test string representation of calculation."""
         calc = Calculation(5.0, 3.0, addition_operation)
         expected = "5.0 + 3.0 = 8.0"
         assert str(calc) == expected
     
+    def test_calculation_str_is_cached(self, addition_operation):
+        """Test that the string form is rendered once and then reused."""
+        calc = Calculation(5.0, 3.0, addition_operation)
+        assert calc._str_cache is None
+        first = str(calc)
+        assert calc._str_cache == "5.0 + 3.0 = 8.0"
+        assert str(calc) is first
+    
     def test_calculation_repr_representation(self, addition_operation):
         """Test detailed string representation of calculation."""
         calc = Calculation(5.0, 3.0, addition_operation)
@@ -86,6 +120,33 @@ class TestCalculation:
         calc = Calculation(5.0, 0.0, division_operation)
         with pytest.raises(ZeroDivisionError):
             _ = calc.result
+    
+    def test_calculation_preserves_signed_zero(self, addition_operation):
+        """Test that signed zeros are kept in the result."""
+        assert str(Calculation(-0.0, -0.0, addition_operation).result) == "-0.0"
+        assert str(Calculation(0.0, -0.0, addition_operation).result) == "0.0"
+    
+    def test_calculation_uses_reassigned_operation(self, addition_operation, multiplication_operation):
+        """Test that the result comes from the operation set when it is first read."""
+        calc = Calculation(3.0, 4.0, addition_operation)
+        calc.operation = multiplication_operation
+        assert calc.result == 12.0
+    
+    def test_calculation_uses_current_operation_state(self):
+        """Test that each calculation asks its operation, not an earlier result."""
+        class Scale:
+            symbol = "k*"
+            
+            def __init__(self, k):
+                self.k = k
+            
+            def compute(self, a, b):
+                return self.k * a * b
+        
+        scale = Scale(2)
+        assert Calculation(3.0, 4.0, scale).result == 24.0
+        scale.k = 10
+        assert Calculation(3.0, 4.0, scale).result == 120.0
 
 
 class TestCalculationFactory:
@@ -156,11 +217,34 @@ class TestCalculationFactory:
         assert calc.operand_a == 5.0
         assert calc.operand_b == 3.0
     
+    def test_factory_eager_computes_result(self, addition_operation):
+        """Test that eager creation stores the result up front."""
+        calc = CalculationFactory.create_calculation(5, 3, addition_operation, eager=True)
+        assert calc._result == 8.0
+    
+    def test_factory_eager_division_by_zero(self, division_operation):
+        """Test that eager creation raises instead of returning a calculation."""
+        with pytest.raises(ZeroDivisionError):
+            CalculationFactory.create_calculation(5.0, 0.0, division_operation, eager=True)
+    
+    def test_factory_accepts_real_operands(self, addition_operation):
+        """Test that any real number type is accepted."""
+        calc = CalculationFactory.create_calculation(Fraction(1, 2), Fraction(5, 2), addition_operation)
+        assert calc.operand_a == 0.5
+        assert calc.operand_b == 2.5
+        assert calc.result == 3.0
+    
     @pytest.mark.parametrize("invalid_operand", [
         None,
         [],
         {},
         "not_a_number",
+        "5",
+        "nan",
+        b"5",
+        bytearray(b"5"),
+        memoryview(b"7"),
+        Decimal("2.5"),
         complex(1, 2),
     ])
     def test_factory_invalid_operand_types(self, addition_operation, invalid_operand):
@@ -3,15 +3,78 @@ Comprehensive unit tests for calculator module.
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
-from io import StringIO
-import sys
 
 from app.calculator.calculator import (
-    Calculator, CalculationHistory, InputValidator
+    CalculationHistory, InputValidator,
+    validate_number, validate_operation, validate_command,
+    _is_valid_operation, _is_valid_command
 )
 from app.calculation.calculation import Calculation
-from app.operation.operations import Addition, Division
+from app.operation.operations import Addition
+
+
+_VALID_NUMBERS = (
+    ("5", 5.0),
+    ("3.14", 3.14),
+    ("-5", -5.0),
+    ("0", 0.0),
+    ("  5.5  ", 5.5),  # Test with whitespace
+    ("1e6", 1000000.0),
+    ("1.5e-3", 0.0015),
+)
+
+_INVALID_NUMBERS = (
+    "not_a_number",
+    "5.5.5",
+    "abc",
+    "",
+    "5 + 3",
+    "infinity",
+    "-inf",
+    "nan",
+    "1_000",  # Digit grouping is not accepted
+)
+
+_VALID_OPS = (
+    "+", "-", "*", "/",
+    "add", "sub", "mul", "div",
+    "addition", "subtraction", "multiplication", "division",
+)
+
+_INVALID_OPS = ("invalid", "++", "mod", "%", "^", "**")
+
+_VALID_COMMANDS = ("help", "history", "exit", "quit", "clear")
+
+_INVALID_COMMANDS = ("invalid", "run", "save", "load")
+
+# (input, history length, last result, expected output) for Calculator.run;
+# input is either the lines to enter or an exception class that input() raises
+_RUN_SCENARIOS = (
+    # Basic calculation
+    (["5 + 3", "exit"], 1, 8.0, "Result: 5.0 + 3.0 = 8.0\n"),
+    # Help command
+    (["help", "exit"], 0, None, "CALCULATOR HELP"),
+    # Empty input is skipped
+    (["", "   ", "exit"], 0, None, "Goodbye!\n"),
+    # Keyboard interrupt and EOF exit gracefully
+    (KeyboardInterrupt, 0, None, "Goodbye!\n"),
+    (EOFError, 0, None, "Goodbye!\n"),
+)
+
+_RUN_SCENARIO_IDS = ("calculation", "help", "empty-input", "keyboard-interrupt", "eof")
+
+
+def _mock_input(seq, monkeypatch):
+    """Replace input() with a stub that returns the given lines in order."""
+    lines = iter(seq)
+    monkeypatch.setattr('builtins.input', lambda prompt='': next(lines))
+
+
+def _raiser(exc):
+    """Return a stand-in for input() that raises the given exception class."""
+    def raise_exc(prompt=''):
+        raise exc()
+    return raise_exc
 
 
 class TestCalculationHistory:
@@ -22,7 +85,7 @@ class TestCalculationHistory:
         history = CalculationHistory()
         assert len(history) == 0
         assert not bool(history)
-        assert history.get_history() == []
+        assert history.get_history() == ()
         assert history.get_last_calculation() is None
     
     def test_add_calculation(self):
@@ -55,6 +118,17 @@ class TestCalculationHistory:
         assert history_list[0] is calc1
         assert history_list[1] is calc2
     
+    def test_iterate_history(self):
+        """Test iterating over history in insertion order."""
+        history = CalculationHistory()
+        operation = Addition()
+        calc1 = Calculation(5.0, 3.0, operation)
+        calc2 = Calculation(10.0, 2.0, operation)
+        history.add_calculation(calc1)
+        history.add_calculation(calc2)
+        
+        assert list(history) == [calc1, calc2]
+    
     def test_add_invalid_calculation(self):
         """Test adding invalid calculation type."""
         history = CalculationHistory()
@@ -63,16 +137,17 @@ class TestCalculationHistory:
         assert "Must provide a Calculation instance" in str(exc_info.value)
     
     def test_get_history_returns_copy(self):
-        """Test that get_history returns a copy."""
+        """Test that get_history returns an immutable copy."""
         history = CalculationHistory()
         operation = Addition()
         calc = Calculation(5.0, 3.0, operation)
         
         history.add_calculation(calc)
         history_copy = history.get_history()
+        assert isinstance(history_copy, tuple)
         
-        # Modifying the copy should not affect original
-        history_copy.clear()
+        # Modifying a materialized copy should not affect original
+        list(history_copy).clear()
         assert len(history) == 1
         assert len(history.get_history()) == 1
     
@@ -89,352 +164,273 @@ class TestCalculationHistory:
         assert len(history) == 0
         assert not bool(history)
         assert history.get_last_calculation() is None
+    
+    def test_clear_history_keeps_snapshot_intact(self, calculator):
+        """Test that calculations handed out before a clear are left untouched."""
+        calculator._handle_calculation_input("5 + 3")
+        snapshot = calculator.history.get_history()
+        
+        calculator.history.clear_history()
+        calculator._handle_calculation_input("9 * 9")
+        
+        assert str(snapshot[0]) == "5.0 + 3.0 = 8.0"
+        assert snapshot[0] is not calculator.history.get_last_calculation()
 
 
 class TestInputValidator:
     """Comprehensive tests for InputValidator class."""
     
-    @pytest.mark.parametrize("input_str,expected", [
-        ("5", 5.0),
-        ("3.14", 3.14),
-        ("-5", -5.0),
-        ("0", 0.0),
-        ("  5.5  ", 5.5),  # Test with whitespace
-        ("1e6", 1000000.0),
-        ("1.5e-3", 0.0015),
-    ])
+    @pytest.mark.parametrize("input_str,expected", _VALID_NUMBERS, ids=repr)
     def test_validate_number_success(self, input_str, expected):
         """Test successful number validation."""
         result = InputValidator.validate_number(input_str)
         assert result == expected
     
-    @pytest.mark.parametrize("invalid_input", [
-        "not_a_number",
-        "5.5.5",
-        "abc",
-        "",
-        "5 + 3",
-        "infinity",
-    ])
+    @pytest.mark.parametrize("invalid_input", _INVALID_NUMBERS, ids=repr)
     def test_validate_number_failure(self, invalid_input):
         """Test number validation failures."""
         with pytest.raises(ValueError) as exc_info:
             InputValidator.validate_number(invalid_input)
         assert f"'{invalid_input}' is not a valid number" in str(exc_info.value)
     
-    @pytest.mark.parametrize("operation", [
-        "+", "-", "*", "/",
-        "add", "sub", "mul", "div",
-        "addition", "subtraction", "multiplication", "division",
-    ])
-    def test_validate_operation_success(self, operation):
+    def test_validate_operation_success(self):
         """Test successful operation validation."""
-        assert InputValidator.validate_operation(operation) is True
-        # Test case insensitive
-        assert InputValidator.validate_operation(operation.upper()) is True
-        # Test with whitespace
-        assert InputValidator.validate_operation(f"  {operation}  ") is True
-    
-    @pytest.mark.parametrize("invalid_operation", [
-        "invalid", "++", "mod", "%", "^", "**"
-    ])
+        for operation in _VALID_OPS:
+            assert InputValidator.validate_operation(operation) is True
+            # Test case insensitive
+            assert InputValidator.validate_operation(operation.upper()) is True
+            # Test with whitespace
+            assert InputValidator.validate_operation(f"  {operation}  ") is True
+    
+    @pytest.mark.parametrize("invalid_operation", _INVALID_OPS, ids=repr)
     def test_validate_operation_failure(self, invalid_operation):
         """Test operation validation failures."""
         assert InputValidator.validate_operation(invalid_operation) is False
     
-    @pytest.mark.parametrize("command", [
-        "help", "history", "exit", "quit", "clear"
-    ])
-    def test_validate_command_success(self, command):
+    def test_validate_command_success(self):
         """Test successful command validation."""
-        assert InputValidator.validate_command(command) is True
-        # Test case insensitive
-        assert InputValidator.validate_command(command.upper()) is True
-        # Test with whitespace
-        assert InputValidator.validate_command(f"  {command}  ") is True
-    
-    @pytest.mark.parametrize("invalid_command", [
-        "invalid", "run", "save", "load"
-    ])
+        for command in _VALID_COMMANDS:
+            assert InputValidator.validate_command(command) is True
+            # Test case insensitive
+            assert InputValidator.validate_command(command.upper()) is True
+            # Test with whitespace
+            assert InputValidator.validate_command(f"  {command}  ") is True
+    
+    @pytest.mark.parametrize("invalid_command", _INVALID_COMMANDS, ids=repr)
     def test_validate_command_failure(self, invalid_command):
         """Test command validation failures."""
         assert InputValidator.validate_command(invalid_command) is False
+    
+    def test_static_methods_alias_module_functions(self):
+        """Test that the class exposes the module-level validators."""
+        assert InputValidator.validate_number is validate_number
+        assert InputValidator.validate_operation is validate_operation
+        assert InputValidator.validate_command is validate_command
+    
+    def test_repeated_validation_hits_cache(self):
+        """Test that repeated validations are answered from the cache."""
+        _is_valid_operation.cache_clear()
+        _is_valid_command.cache_clear()
+        
+        for _ in range(3):
+            assert validate_operation("  ADD  ") is True
+            assert validate_command("  HELP  ") is True
+        
+        assert _is_valid_operation.cache_info().hits == 2
+        assert _is_valid_command.cache_info().hits == 2
 
 
 class TestCalculator:
     """Comprehensive tests for Calculator class."""
     
-    def test_calculator_initialization(self):
+    def test_calculator_initialization(self, calculator):
         """Test calculator initialization."""
-        calc = Calculator()
-        assert isinstance(calc.history, CalculationHistory)
-        assert isinstance(calc.validator, InputValidator)
-        assert calc.running is False
+        assert isinstance(calculator.history, CalculationHistory)
+        assert not hasattr(calculator, 'validator')
+        assert calculator.running is False
     
-    def test_parse_input_success(self):
+    def test_parse_input_success(self, calculator):
         """Test successful input parsing."""
-        calc = Calculator()
-        
         # Test basic operations
-        result = calc._parse_input("5 + 3")
+        result = calculator._parse_input("5 + 3")
         assert result == (5.0, "+", 3.0)
         
-        result = calc._parse_input("10.5 * 2")
+        result = calculator._parse_input("10.5 * 2")
         assert result == (10.5, "*", 2.0)
         
-        result = calc._parse_input("7 div 2")
+        result = calculator._parse_input("7 div 2")
         assert result == (7.0, "div", 2.0)
     
-    def test_parse_input_invalid_format(self):
-        """Test input parsing with invalid format."""
-        calc = Calculator()
+    def test_parse_input_number_forms(self, calculator):
+        """Test that the parser accepts every literal form the validator does."""
+        # Dot-only and exponent literals share one grammar with validate_number
+        assert calculator._parse_input(".5 + 5.") == (0.5, "+", 5.0)
+        assert calculator._parse_input("  2E3 MUL -1  ") == (2000.0, "mul", -1.0)
         
+        # Overflowing literals are rejected by the validator
+        with pytest.raises(ValueError) as exc_info:
+            calculator._parse_input("1e999 + 1")
+        assert "'1e999' is not a valid number" in str(exc_info.value)
+    
+    def test_parse_input_with_presplit_parts(self, calculator):
+        """Test that parsing reuses tokens that were already split."""
+        result = calculator._parse_input("ignored", ["5", "ADD", "3"])
+        assert result == (5.0, "add", 3.0)
+        assert calculator._is_command("ignored", ["help"]) is True
+    
+    def test_parse_input_invalid_format(self, calculator):
+        """Test input parsing with invalid format."""
         # Too few parts
         with pytest.raises(ValueError) as exc_info:
-            calc._parse_input("5 +")
+            calculator._parse_input("5 +")
         assert "exactly three parts" in str(exc_info.value)
         
         # Too many parts
         with pytest.raises(ValueError) as exc_info:
-            calc._parse_input("5 + 3 + 2")
+            calculator._parse_input("5 + 3 + 2")
         assert "exactly three parts" in str(exc_info.value)
     
-    def test_parse_input_invalid_operands(self):
+    def test_parse_input_invalid_operands(self, calculator):
         """Test input parsing with invalid operands."""
-        calc = Calculator()
-        
         with pytest.raises(ValueError) as exc_info:
-            calc._parse_input("abc + 3")
+            calculator._parse_input("abc + 3")
         assert "'abc' is not a valid number" in str(exc_info.value)
         
         with pytest.raises(ValueError) as exc_info:
-            calc._parse_input("5 + def")
+            calculator._parse_input("5 + def")
         assert "'def' is not a valid number" in str(exc_info.value)
     
-    def test_parse_input_invalid_operation(self):
+    def test_parse_input_invalid_operation(self, calculator):
         """Test input parsing with invalid operation."""
-        calc = Calculator()
-        
         with pytest.raises(ValueError) as exc_info:
-            calc._parse_input("5 % 3")
+            calculator._parse_input("5 % 3")
         assert "Unsupported operation: %" in str(exc_info.value)
         assert "Available:" in str(exc_info.value)
     
-    def test_perform_calculation_success(self):
+    def test_perform_calculation_success(self, calculator):
         """Test successful calculation performance."""
-        calc = Calculator()
-        
-        result = calc._perform_calculation(5.0, "+", 3.0)
+        result = calculator._perform_calculation(5.0, "+", 3.0)
         assert isinstance(result, Calculation)
+        assert result._result == 8.0
         assert result.result == 8.0
     
-    def test_perform_calculation_division_by_zero(self):
+    def test_perform_calculation_division_by_zero(self, capsys, calculator):
         """Test calculation with division by zero."""
-        calc = Calculator()
-        
-        with patch('builtins.print') as mock_print:
-            result = calc._perform_calculation(5.0, "/", 0.0)
-            assert result is None
-            mock_print.assert_called()
-            call_args = str(mock_print.call_args)
-            assert "Math error" in call_args
+        result = calculator._perform_calculation(5.0, "/", 0.0)
+        assert result is None
+        assert "Math error" in capsys.readouterr().out
     
-    def test_is_command(self):
+    def test_is_command(self, calculator):
         """Test command detection."""
-        calc = Calculator()
-        
-        assert calc._is_command("help") is True
-        assert calc._is_command("history") is True
-        assert calc._is_command("exit") is True
-        assert calc._is_command("5 + 3") is False
-        assert calc._is_command("help me please") is True  # First word is command
+        assert calculator._is_command("help") is True
+        assert calculator._is_command("history") is True
+        assert calculator._is_command("exit") is True
+        assert calculator._is_command("5 + 3") is False
+        assert calculator._is_command("help me please") is True  # First word is command
     
-    @patch('builtins.print')
-    def test_handle_command_help(self, mock_print):
+    def test_handle_command_help(self, capsys, calculator):
         """Test help command handling."""
-        calc = Calculator()
-        calc._handle_command("help")
+        calculator._handle_command("help")
         
         # Check that help was printed
-        mock_print.assert_called()
-        call_args_list = [str(call) for call in mock_print.call_args_list]
-        combined_output = " ".join(call_args_list)
-        assert "CALCULATOR HELP" in combined_output
+        assert "CALCULATOR HELP" in capsys.readouterr().out
     
-    @patch('builtins.print')
-    def test_handle_command_history_empty(self, mock_print):
+    def test_handle_command_history_empty(self, capsys, calculator):
         """Test history command with empty history."""
-        calc = Calculator()
-        calc._handle_command("history")
+        calculator._handle_command("history")
         
-        mock_print.assert_called_with("No calculations in history.")
+        assert capsys.readouterr().out == "No calculations in history.\n"
     
-    @patch('builtins.print')
-    def test_handle_command_history_with_calculations(self, mock_print):
+    def test_handle_command_history_with_calculations(self, capsys, calculator):
         """Test history command with calculations."""
-        calc = Calculator()
         operation = Addition()
         calc1 = Calculation(5.0, 3.0, operation)
         calc2 = Calculation(10.0, 2.0, operation)
         
-        calc.history.add_calculation(calc1)
-        calc.history.add_calculation(calc2)
+        calculator.history.add_calculation(calc1)
+        calculator.history.add_calculation(calc2)
         
-        calc._handle_command("history")
+        calculator._handle_command("history")
         
-        # Check that history was printed
-        mock_print.assert_called()
-        call_args_list = [str(call) for call in mock_print.call_args_list]
-        combined_output = " ".join(call_args_list)
-        assert "CALCULATION HISTORY" in combined_output
+        # Check that the whole listing was written
+        output = capsys.readouterr().out
+        assert "CALCULATION HISTORY" in output
+        assert " 1. 5.0 + 3.0 = 8.0\n" in output
+        assert " 2. 10.0 + 2.0 = 12.0\n" in output
     
-    @patch('builtins.print')
-    def test_handle_command_clear(self, mock_print):
+    def test_handle_command_clear(self, capsys, calculator):
         """Test clear command handling."""
-        calc = Calculator()
         operation = Addition()
-        calc.history.add_calculation(Calculation(5.0, 3.0, operation))
+        calculator.history.add_calculation(Calculation(5.0, 3.0, operation))
         
-        calc._handle_command("clear")
+        calculator._handle_command("clear")
         
-        assert len(calc.history) == 0
-        mock_print.assert_called_with("Calculation history cleared.")
+        assert len(calculator.history) == 0
+        assert capsys.readouterr().out == "Calculation history cleared.\n"
     
-    def test_handle_command_exit(self):
+    def test_handle_command_exit(self, capsys, calculator):
         """Test exit command handling."""
-        calc = Calculator()
-        calc.running = True
+        calculator.running = True
+        
+        calculator._handle_command("exit")
         
-        with patch('builtins.print') as mock_print:
-            calc._handle_command("exit")
-            
-        assert calc.running is False
-        mock_print.assert_called_with("Goodbye!")
+        assert calculator.running is False
+        assert capsys.readouterr().out == "Goodbye!\n"
     
-    def test_handle_command_quit(self):
+    def test_handle_command_quit(self, capsys, calculator):
         """Test quit command handling."""
-        calc = Calculator()
-        calc.running = True
+        calculator.running = True
         
-        with patch('builtins.print') as mock_print:
-            calc._handle_command("quit")
-            
-        assert calc.running is False
-        mock_print.assert_called_with("Goodbye!")
+        calculator._handle_command("quit")
+        
+        assert calculator.running is False
+        assert capsys.readouterr().out == "Goodbye!\n"
     
-    @patch('builtins.print')
-    def test_handle_calculation_input_success(self, mock_print):
+    def test_handle_calculation_input_success(self, capsys, calculator):
         """Test successful calculation input handling."""
-        calc = Calculator()
-        
-        calc._handle_calculation_input("5 + 3")
+        calculator._handle_calculation_input("5 + 3")
         
-        assert len(calc.history) == 1
-        assert calc.history.get_last_calculation().result == 8.0
+        assert len(calculator.history) == 1
+        assert calculator.history.get_last_calculation().result == 8.0
         
         # Check that result was printed
-        mock_print.assert_called()
-        call_args = str(mock_print.call_args_list[-1])
-        assert "Result:" in call_args and "8.0" in call_args
+        assert capsys.readouterr().out == "Result: 5.0 + 3.0 = 8.0\n"
     
-    @patch('builtins.print')
-    def test_handle_calculation_input_invalid_format(self, mock_print):
+    def test_handle_calculation_input_invalid_format(self, capsys, calculator):
         """Test calculation input with invalid format."""
-        calc = Calculator()
-        
-        calc._handle_calculation_input("5 +")
+        calculator._handle_calculation_input("5 +")
         
-        assert len(calc.history) == 0
-        mock_print.assert_called()
-        call_args = str(mock_print.call_args_list)
-        assert "Input error" in call_args
+        assert len(calculator.history) == 0
+        assert "Input error" in capsys.readouterr().out
     
-    @patch('builtins.print')
-    def test_handle_calculation_input_division_by_zero(self, mock_print):
+    def test_handle_calculation_input_division_by_zero(self, capsys, calculator):
         """Test calculation input with division by zero."""
-        calc = Calculator()
-        
-        calc._handle_calculation_input("5 / 0")
-        
-        assert len(calc.history) == 0
-        mock_print.assert_called()
-        call_args = str(mock_print.call_args_list)
-        assert "Math error" in call_args
-    
-    @patch('builtins.input')
-    @patch('builtins.print')
-    def test_run_basic_calculation(self, mock_print, mock_input):
-        """Test running calculator with basic calculation."""
-        mock_input.side_effect = ["5 + 3", "exit"]
-        
-        calc = Calculator()
-        calc.run()
-        
-        assert len(calc.history) == 1
-        assert calc.history.get_last_calculation().result == 8.0
-    
-    @patch('builtins.input')
-    @patch('builtins.print')
-    def test_run_help_command(self, mock_print, mock_input):
-        """Test running calculator with help command."""
-        mock_input.side_effect = ["help", "exit"]
-        
-        calc = Calculator()
-        calc.run()
-        
-        # Check that help was displayed
-        call_args_list = [str(call) for call in mock_print.call_args_list]
-        combined_output = " ".join(call_args_list)
-        assert "CALCULATOR HELP" in combined_output
-    
-    @patch('builtins.input')
-    @patch('builtins.print')
-    def test_run_empty_input(self, mock_print, mock_input):
-        """Test running calculator with empty input."""
-        mock_input.side_effect = ["", "   ", "exit"]
-        
-        calc = Calculator()
-        calc.run()
-        
-        # Should handle empty input gracefully
-        assert len(calc.history) == 0
-    
-    @patch('builtins.input')
-    @patch('builtins.print')
-    def test_run_keyboard_interrupt(self, mock_print, mock_input):
-        """Test running calculator with keyboard interrupt."""
-        mock_input.side_effect = KeyboardInterrupt()
-        
-        calc = Calculator()
-        calc.run()
-        
-        # Should handle keyboard interrupt gracefully
-        mock_print.assert_called()
-        call_args = str(mock_print.call_args_list)
-        assert "Goodbye!" in call_args
-    
-    @patch('builtins.input')
-    @patch('builtins.print')
-    def test_run_eof_error(self, mock_print, mock_input):
-        """Test running calculator with EOF error."""
-        mock_input.side_effect = EOFError()
-        
-        calc = Calculator()
-        calc.run()
-        
-        # Should handle EOF error gracefully
-        mock_print.assert_called()
-        call_args = str(mock_print.call_args_list)
-        assert "Goodbye!" in call_args
-    
-    @patch('builtins.print')
-    def test_display_welcome(self, mock_print):
+        calculator._handle_calculation_input("5 / 0")
+        
+        assert len(calculator.history) == 0
+        assert "Math error" in capsys.readouterr().out
+    
+    @pytest.mark.parametrize("inputs, history_len, last_result, expected_output", _RUN_SCENARIOS,
+                             ids=_RUN_SCENARIO_IDS)
+    def test_run_scenarios(self, monkeypatch, capsys, calculator,
+                           inputs, history_len, last_result, expected_output):
+        """Test running the calculator against scripted input."""
+        if isinstance(inputs, type):
+            monkeypatch.setattr('builtins.input', _raiser(inputs))
+        else:
+            _mock_input(inputs, monkeypatch)
+        
+        calculator.run()
+        
+        last = calculator.history.get_last_calculation()
+        assert len(calculator.history) == history_len
+        assert (last.result if last is not None else None) == last_result
+        assert expected_output in capsys.readouterr().out
+    
+    def test_display_welcome(self, capsys, calculator):
         """Test welcome message display."""
-        calc = Calculator()
-        calc._display_welcome()
-        
-        mock_print.assert_called()
-        call_args_list = [str(call) for call in mock_print.call_args_list]
-        combined_output = " ".join(call_args_list)
-        assert "Professional Calculator Application" in combined_output
-        assert "Type 'help' for instructions" in combined_output
\ No newline at end of file
+        calculator._display_welcome()
+        
+        output = capsys.readouterr().out
+        assert "Professional Calculator Application" in output
+        assert "Type 'help' for instructions" in output
\ No newline at end of file
@@ -0,0 +1,127 @@
+"""
+Unit tests for the column-oriented history buffer.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.calculator.calculator import CalculationHistory
+from app.calculator.history_buffer import HistoryBuffer
+from app.calculation.calculation import Calculation
+from app.operation.operations import OPERATIONS
+
+
+def _calculations():
+    """Build one calculation per canonical operation."""
+    return [
+        Calculation(5.0, 3.0, OPERATIONS['+']),
+        Calculation(5.0, 3.0, OPERATIONS['-']),
+        Calculation(2.5, 4.0, OPERATIONS['*']),
+        Calculation(7.0, 2.0, OPERATIONS['/']),
+    ]
+
+
+class TestHistoryBuffer:
+    """Comprehensive tests for HistoryBuffer class."""
+    
+    def test_buffer_initialization(self):
+        """Test buffer initialization."""
+        buffer = HistoryBuffer()
+        assert len(buffer) == 0
+        assert not bool(buffer)
+        assert buffer.get_history() == []
+        assert buffer.results.size == 0
+    
+    def test_add_calculations(self):
+        """Test that calculations are stored column by column."""
+        buffer = HistoryBuffer()
+        for calc in _calculations():
+            buffer.add_calculation(calc)
+        
+        assert len(buffer) == 4
+        assert bool(buffer)
+        assert buffer.operands_a.tolist() == [5.0, 5.0, 2.5, 7.0]
+        assert buffer.operands_b.tolist() == [3.0, 3.0, 4.0, 2.0]
+        assert buffer.results.tolist() == [8.0, 2.0, 10.0, 3.5]
+    
+    def test_column_views_are_read_only(self):
+        """Test that exposed columns cannot be modified."""
+        buffer = HistoryBuffer()
+        buffer.add_calculation(_calculations()[0])
+        with pytest.raises(ValueError):
+            buffer.results[0] = 0.0
+    
+    def test_buffer_grows_geometrically(self):
+        """Test that the buffer doubles its capacity when full."""
+        buffer = HistoryBuffer(capacity=2)
+        for i in range(5):
+            buffer.add_calculation(Calculation(float(i), 1.0, OPERATIONS['+']))
+        
+        assert len(buffer) == 5
+        assert buffer._cap == 8
+        assert buffer.results.tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    
+    def test_replay_matches_stored_results(self):
+        """Test that vectorized replay reproduces every result."""
+        buffer = HistoryBuffer()
+        for calc in _calculations():
+            buffer.add_calculation(calc)
+        
+        assert buffer.replay().tolist() == buffer.results.tolist()
+    
+    def test_materialize_entries(self):
+        """Test that entries are materialized as equivalent calculations."""
+        buffer = HistoryBuffer()
+        calcs = _calculations()
+        for calc in calcs:
+            buffer.add_calculation(calc)
+        
+        materialized = buffer.get_history()
+        assert [str(calc) for calc in materialized] == [str(calc) for calc in calcs]
+        assert buffer[-1].operation is OPERATIONS['/']
+        assert buffer[-1]._result == 3.5
+    
+    def test_index_out_of_range(self):
+        """Test that out-of-range access raises IndexError."""
+        buffer = HistoryBuffer()
+        with pytest.raises(IndexError):
+            _ = buffer[0]
+    
+    def test_add_invalid_calculation(self):
+        """Test adding invalid calculation type."""
+        buffer = HistoryBuffer()
+        with pytest.raises(TypeError) as exc_info:
+            buffer.add_calculation("not_a_calculation")
+        assert "Must provide a Calculation instance" in str(exc_info.value)
+    
+    def test_add_unsupported_operation(self):
+        """Test that operations without an id are rejected."""
+        class Modulo:
+            symbol = "%"
+            
+            def compute(self, a, b):
+                return a % b
+        
+        buffer = HistoryBuffer()
+        with pytest.raises(ValueError) as exc_info:
+            buffer.add_calculation(Calculation(5.0, 3.0, Modulo()))
+        assert "Unsupported operation for history buffer: %" in str(exc_info.value)
+    
+    def test_clear_history(self):
+        """Test clearing the buffer."""
+        buffer = HistoryBuffer()
+        buffer.add_calculation(_calculations()[0])
+        buffer.clear_history()
+        assert len(buffer) == 0
+    
+    def test_history_to_buffer(self):
+        """Test converting a calculation history into a buffer."""
+        history = CalculationHistory()
+        for calc in _calculations():
+            history.add_calculation(calc)
+        
+        buffer = history.to_buffer()
+        assert isinstance(buffer, HistoryBuffer)
+        assert len(buffer) == len(history)
+        assert buffer.results.tolist() == [calc.result for calc in history]
@@ -0,0 +1,86 @@
+"""
+Unit tests for the compiled batch operation kernels.
+"""
+
+import importlib
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("numba")
+
+from app.operation import kernels
+from app.operation.kernels import BATCH_OPERATIONS, compute_batch
+from app.operation.operations import OPERATIONS
+
+
+class TestBatchKernels:
+    """Tests for the batch kernels and their registry."""
+    
+    def test_batch_registry_covers_canonical_symbols(self):
+        """Test that every canonical symbol has a batch kernel."""
+        assert set(BATCH_OPERATIONS) == {'+', '-', '*', '/'}
+    
+    @pytest.mark.parametrize("symbol,kernel", [
+        ('+', kernels._add_kernel),
+        ('-', kernels._sub_kernel),
+        ('*', kernels._mul_kernel),
+        ('/', kernels._div_kernel),
+    ])
+    def test_compiled_kernels_match_python_source(self, symbol, kernel):
+        """Test that the compiled kernels agree with their Python source."""
+        operands_a = np.array([5.0, -5.0, 3.5, 0.1])
+        operands_b = np.array([3.0, 3.0, 2.1, 0.2])
+        expected = kernel(operands_a, operands_b)
+        assert BATCH_OPERATIONS[symbol](operands_a, operands_b).tolist() == expected.tolist()
+    
+    def test_python_division_kernel_rejects_zero(self):
+        """Test that the division kernel source checks for zero divisors."""
+        with pytest.raises(ZeroDivisionError):
+            kernels._div_kernel(np.array([1.0]), np.array([0.0]))
+    
+    @pytest.mark.parametrize("symbol", ['+', '-', '*', '/'])
+    def test_batch_matches_scalar_compute(self, symbol):
+        """Test that batch results agree with the scalar compute method."""
+        operation = OPERATIONS[symbol]
+        operands_a = [5.0, -5.0, 3.5, 0.1, 1e15, 0.0]
+        operands_b = [3.0, 3.0, 2.1, 0.2, 1e15, 4.0]
+        result = operation.compute_batch(operands_a, operands_b)
+        expected = [operation.compute(a, b) for a, b in zip(operands_a, operands_b)]
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == expected
+    
+    def test_batch_accepts_integer_arrays(self):
+        """Test that integer inputs are converted to float64."""
+        result = compute_batch('*', np.array([1, 2, 3]), np.array([4, 5, 6]))
+        assert result.dtype == np.float64
+        assert result.tolist() == [4.0, 10.0, 18.0]
+    
+    def test_batch_empty_input(self):
+        """Test batch computation over empty arrays."""
+        assert compute_batch('+', [], []).size == 0
+    
+    def test_batch_length_mismatch(self):
+        """Test that operand arrays of different lengths are rejected."""
+        with pytest.raises(ValueError) as exc_info:
+            compute_batch('+', [1.0, 2.0], [1.0])
+        assert "same length" in str(exc_info.value)
+    
+    def test_batch_division_by_zero(self):
+        """Test that batch division by zero raises the scalar error."""
+        with pytest.raises(ZeroDivisionError) as exc_info:
+            OPERATIONS['/'].compute_batch([1.0, 2.0], [1.0, 0.0])
+        assert "Cannot divide by zero" in str(exc_info.value)
+    
+    def test_jit_fallback_without_aot_extension(self, monkeypatch):
+        """Test that the kernels are JIT-compiled when the extension is not built."""
+        import app.operation
+        monkeypatch.delattr(app.operation, 'op_kernels', raising=False)
+        monkeypatch.setitem(sys.modules, 'app.operation.op_kernels', None)
+        try:
+            reloaded = importlib.reload(kernels)
+            assert reloaded.compute_batch('+', [1.0, 2.0], [3.0, 4.0]).tolist() == [4.0, 6.0]
+        finally:
+            monkeypatch.undo()
+            importlib.reload(kernels)
@@ -5,10 +5,70 @@ Comprehensive unit tests for operation classes.
 import pytest
 from app.operation.operations import (
     Addition, Subtraction, Multiplication, Division,
-    OPERATIONS, Operation
+    OPERATIONS, OPERATION_KEYS, OP_FNS, Operation
 )
 
 
+_ADD_CASES = (
+    (5, 3, 8),
+    (0, 0, 0),
+    (-5, 3, -2),
+    (5, -3, 2),
+    (-5, -3, -8),
+    (3.5, 2.1, 5.6),
+    (0.1, 0.2, 0.3),
+    (1000000, 2000000, 3000000),
+    (-1.5, 2.7, 1.2),
+)
+
+_SUB_CASES = (
+    (5, 3, 2),
+    (0, 0, 0),
+    (-5, 3, -8),
+    (5, -3, 8),
+    (-5, -3, -2),
+    (3.5, 2.1, 1.4),
+    (0.3, 0.1, 0.2),
+    (1000000, 500000, 500000),
+    (-1.5, -2.7, 1.2),
+)
+
+_MUL_CASES = (
+    (5, 3, 15),
+    (0, 5, 0),
+    (5, 0, 0),
+    (-5, 3, -15),
+    (5, -3, -15),
+    (-5, -3, 15),
+    (3.5, 2, 7.0),
+    (0.5, 0.4, 0.2),
+    (100, 0.01, 1.0),
+    (1.5, 2.5, 3.75),
+)
+
+_DIV_CASES = (
+    (6, 3, 2),
+    (5, 2, 2.5),
+    (-6, 3, -2),
+    (6, -3, -2),
+    (-6, -3, 2),
+    (3.6, 1.2, 3.0),
+    (1, 4, 0.25),
+    (7, 2, 3.5),
+    (100, 25, 4),
+)
+
+_OPERATION_CLASSES = (Addition, Subtraction, Multiplication, Division)
+
+
+@pytest.fixture(scope="module")
+def fastmath():
+    """Fixture for the Numba cross-check kernels, skipping when Numba is unavailable."""
+    pytest.importorskip("numba")
+    import _fastmath
+    return _fastmath
+
+
 class TestOperationInterface:
     """Test the operation interface and abstract base class."""
     
@@ -16,6 +76,19 @@ class TestOperationInterface:
         """Test that Operation class cannot be instantiated."""
         with pytest.raises(TypeError):
             Operation()
+    
+    @pytest.mark.parametrize("operation_cls", _OPERATION_CLASSES, ids=lambda cls: cls.__name__)
+    def test_compute_accepts_keyword_operands(self, operation_cls):
+        """Test that compute keeps the abstract method's parameter names."""
+        assert operation_cls().compute(operand_a=6, operand_b=3) == operation_cls().compute(6, 3)
+    
+    @pytest.mark.parametrize("operation_cls", _OPERATION_CLASSES, ids=lambda cls: cls.__name__)
+    def test_operations_use_slots(self, operation_cls):
+        """Test that operations carry no per-instance __dict__."""
+        operation = operation_cls()
+        assert not hasattr(operation, '__dict__')
+        with pytest.raises(AttributeError):
+            operation.unknown_attribute = 1
 
 
 class TestAddition:
@@ -25,22 +98,24 @@ class TestAddition:
         """Test addition symbol."""
         assert addition_operation.symbol == "+"
     
-    @pytest.mark.parametrize("operand_a,operand_b,expected", [
-        (5, 3, 8),
-        (0, 0, 0),
-        (-5, 3, -2),
-        (5, -3, 2),
-        (-5, -3, -8),
-        (3.5, 2.1, 5.6),
-        (0.1, 0.2, 0.3),
-        (1000000, 2000000, 3000000),
-        (-1.5, 2.7, 1.2),
-    ])
+    @pytest.mark.parametrize("operand_a,operand_b,expected", _ADD_CASES[:2], ids=repr)
     def test_addition_compute(self, addition_operation, operand_a, operand_b, expected):
-        """Test addition computation with various inputs."""
+        """Smoke test addition computation on a couple of isolated cases."""
         result = addition_operation.compute(operand_a, operand_b)
         assert abs(result - expected) < 1e-10  # Handle floating point precision
     
+    def test_addition_compute_all_cases(self, addition_operation):
+        """Test addition computation over every case."""
+        for operand_a, operand_b, expected in _ADD_CASES:
+            result = addition_operation.compute(operand_a, operand_b)
+            assert abs(result - expected) < 1e-10  # Handle floating point precision
+    
+    def test_addition_compute_matches_kernel(self, addition_operation, fastmath):
+        """Test that addition agrees with a compiled loop over every case."""
+        results = fastmath.run(fastmath.add_all, _ADD_CASES)
+        for (operand_a, operand_b, _), result in zip(_ADD_CASES, results):
+            assert addition_operation.compute(operand_a, operand_b) == result
+    
     def test_addition_compute_large_numbers(self, addition_operation):
         """Test addition with very large numbers."""
         result = addition_operation.compute(1e15, 1e15)
@@ -59,21 +134,23 @@ class TestSubtraction:
         """Test subtraction symbol."""
         assert subtraction_operation.symbol == "-"
     
-    @pytest.mark.parametrize("operand_a,operand_b,expected", [
-        (5, 3, 2),
-        (0, 0, 0),
-        (-5, 3, -8),
-        (5, -3, 8),
-        (-5, -3, -2),
-        (3.5, 2.1, 1.4),
-        (0.3, 0.1, 0.2),
-        (1000000, 500000, 500000),
-        (-1.5, -2.7, 1.2),
-    ])
+    @pytest.mark.parametrize("operand_a,operand_b,expected", _SUB_CASES[:2], ids=repr)
     def test_subtraction_compute(self, subtraction_operation, operand_a, operand_b, expected):
-        """Test subtraction computation with various inputs."""
+        """Smoke test subtraction computation on a couple of isolated cases."""
         result = subtraction_operation.compute(operand_a, operand_b)
         assert abs(result - expected) < 1e-10  # Handle floating point precision
+    
+    def test_subtraction_compute_all_cases(self, subtraction_operation):
+        """Test subtraction computation over every case."""
+        for operand_a, operand_b, expected in _SUB_CASES:
+            result = subtraction_operation.compute(operand_a, operand_b)
+            assert abs(result - expected) < 1e-10  # Handle floating point precision
+    
+    def test_subtraction_compute_matches_kernel(self, subtraction_operation, fastmath):
+        """Test that subtraction agrees with a compiled loop over every case."""
+        results = fastmath.run(fastmath.sub_all, _SUB_CASES)
+        for (operand_a, operand_b, _), result in zip(_SUB_CASES, results):
+            assert subtraction_operation.compute(operand_a, operand_b) == result
 
 
 class TestMultiplication:
@@ -83,23 +160,24 @@ class TestMultiplication:
         """Test multiplication symbol."""
         assert multiplication_operation.symbol == "*"
     
-    @pytest.mark.parametrize("operand_a,operand_b,expected", [
-        (5, 3, 15),
-        (0, 5, 0),
-        (5, 0, 0),
-        (-5, 3, -15),
-        (5, -3, -15),
-        (-5, -3, 15),
-        (3.5, 2, 7.0),
-        (0.5, 0.4, 0.2),
-        (100, 0.01, 1.0),
-        (1.5, 2.5, 3.75),
-    ])
+    @pytest.mark.parametrize("operand_a,operand_b,expected", _MUL_CASES[:2], ids=repr)
     def test_multiplication_compute(self, multiplication_operation, operand_a, operand_b, expected):
-        """Test multiplication computation with various inputs."""
+        """Smoke test multiplication computation on a couple of isolated cases."""
         result = multiplication_operation.compute(operand_a, operand_b)
         assert abs(result - expected) < 1e-10  # Handle floating point precision
     
+    def test_multiplication_compute_all_cases(self, multiplication_operation):
+        """Test multiplication computation over every case."""
+        for operand_a, operand_b, expected in _MUL_CASES:
+            result = multiplication_operation.compute(operand_a, operand_b)
+            assert abs(result - expected) < 1e-10  # Handle floating point precision
+    
+    def test_multiplication_compute_matches_kernel(self, multiplication_operation, fastmath):
+        """Test that multiplication agrees with a compiled loop over every case."""
+        results = fastmath.run(fastmath.mul_all, _MUL_CASES)
+        for (operand_a, operand_b, _), result in zip(_MUL_CASES, results):
+            assert multiplication_operation.compute(operand_a, operand_b) == result
+    
     def test_multiplication_identity(self, multiplication_operation):
         """Test multiplication by identity (1)."""
         assert multiplication_operation.compute(42, 1) == 42
@@ -113,28 +191,36 @@ class TestDivision:
         """Test division symbol."""
         assert division_operation.symbol == "/"
     
-    @pytest.mark.parametrize("operand_a,operand_b,expected", [
-        (6, 3, 2),
-        (5, 2, 2.5),
-        (-6, 3, -2),
-        (6, -3, -2),
-        (-6, -3, 2),
-        (3.6, 1.2, 3.0),
-        (1, 4, 0.25),
-        (7, 2, 3.5),
-        (100, 25, 4),
-    ])
+    @pytest.mark.parametrize("operand_a,operand_b,expected", _DIV_CASES[:2], ids=repr)
     def test_division_compute(self, division_operation, operand_a, operand_b, expected):
-        """Test division computation with various inputs."""
+        """Smoke test division computation on a couple of isolated cases."""
         result = division_operation.compute(operand_a, operand_b)
         assert abs(result - expected) < 1e-10  # Handle floating point precision
     
+    def test_division_compute_all_cases(self, division_operation):
+        """Test division computation over every case."""
+        for operand_a, operand_b, expected in _DIV_CASES:
+            result = division_operation.compute(operand_a, operand_b)
+            assert abs(result - expected) < 1e-10  # Handle floating point precision
+    
+    def test_division_compute_matches_kernel(self, division_operation, fastmath):
+        """Test that division agrees with a compiled loop over every case."""
+        results = fastmath.run(fastmath.div_all, _DIV_CASES)
+        for (operand_a, operand_b, _), result in zip(_DIV_CASES, results):
+            assert division_operation.compute(operand_a, operand_b) == result
+    
     def test_division_by_zero(self, division_operation):
         """Test division by zero raises appropriate error."""
         with pytest.raises(ZeroDivisionError) as exc_info:
             division_operation.compute(5, 0)
         assert "Cannot divide by zero" in str(exc_info.value)
     
+    def test_division_by_negative_zero(self, division_operation):
+        """Test that negative zero is also rejected as a divisor."""
+        with pytest.raises(ZeroDivisionError) as exc_info:
+            division_operation.compute(5.0, -0.0)
+        assert "Cannot divide by zero" in str(exc_info.value)
+    
     def test_division_zero_dividend(self, division_operation):
         """Test division of zero."""
         result = division_operation.compute(0, 5)
@@ -188,4 +274,19 @@ class TestOperationsRegistry:
         assert OPERATIONS['+'] is OPERATIONS['add']
         assert OPERATIONS['-'] is OPERATIONS['sub']
         assert OPERATIONS['*'] is OPERATIONS['mul']
-        assert OPERATIONS['/'] is OPERATIONS['div']
\ No newline at end of file
+        assert OPERATIONS['/'] is OPERATIONS['div']
+    
+    def test_operations_registry_has_one_instance_per_operation(self):
+        """Test that every alias shares one of four singleton instances."""
+        assert len({id(operation) for operation in OPERATIONS.values()}) == 4
+    
+    def test_operation_keys_match_registry(self):
+        """Test that the key set mirrors the registry and is immutable."""
+        assert OPERATION_KEYS == set(OPERATIONS)
+        assert isinstance(OPERATION_KEYS, frozenset)
+    
+    def test_op_fns_match_registry(self):
+        """Test that the function table holds each registered operation's compute method."""
+        assert set(OP_FNS) == set(OPERATIONS)
+        for key, func in OP_FNS.items():
+            assert func == OPERATIONS[key].compute